@@ -1,22 +1,103 @@
 import discord
-from discord.ext import commands
 import datetime
 import os
 import asyncio
 import logging
-from pytz import timezone
-from typing import Union, List
+from functools import partial
+from typing import Union, List, TYPE_CHECKING
 
 from .customization import EmbedCustomizer
 from .pagination import PaginationView
-from .messagesender import MessageSender
-from .utils import chunk_text, truncate_text
+from .messagesender import MessageSender, _MESSAGE_ERRORS
+from .utils import chunk_text, truncate_text, get_timezone
+
+if TYPE_CHECKING:
+    from discord.ext import commands
 
 logger = logging.getLogger("EmbedBuilder")
 
 
+def _normalise_fields(fields) -> List[tuple]:
+    normalised = []
+    for field in fields:
+        if len(field) not in (2, 3):
+            raise ValueError(
+                f"Field tuple must have 2 or 3 elements, got {len(field)}")
+        normalised.append(
+            (truncate_text(str(field[0]), 256), truncate_text(str(field[1]), 1024),
+             field[2] if len(field) == 3 else False))
+    return normalised
+
+
 class EmbedBuilder:
-    def __init__(self, source: Union[commands.Context, discord.Interaction, discord.TextChannel, discord.DMChannel, discord.ForumChannel, discord.Thread, discord.User, discord.Member, discord.Message]):
+    __slots__ = (
+        'source', 'message_sender', 'customizer',
+        '_title', '_description', '_color', '_url', '_timestamp',
+        '_author_name', '_author_icon_url', '_author_url',
+        '_footer_text', '_footer_icon_url',
+        '_thumbnail_url', '_image_url',
+        '_content', '_fields', '_files', '_file_path',
+        '_reply', '_ephemeral', '_delete_after', '_view', '_allowed_mentions',
+        '_tts', '_suppress_embeds', '_silent', '_mention_author', '_stickers',
+        '_max_embeds', '_max_parallel_sends', '_embed_color_gradient',
+        '_timezone_str', '_timezone', '_paginated', '_pages', '_pagination_timeout',
+        '_edit_message', '_override_user',
+        '_create_thread', '_thread_name', '_thread_auto_archive_duration',
+        '_thread_reason', '_created_thread',
+        '_forum_thread_name', '_forum_thread_content',
+    )
+
+    _aliases = {
+        'thumb': 'set_thumbnail',
+        'img': 'set_image',
+        'image': 'set_image',
+        'color': 'set_color',
+        'colour': 'set_color',
+        'set_colour': 'set_color',
+        'title': 'set_title',
+        'desc': 'set_description',
+        'description': 'set_description',
+        'delete_after': 'set_delete_after',
+        'delete': 'set_delete_after',
+        'author': 'set_author',
+        'footer': 'set_footer',
+        'field': 'add_field',
+        'fields': 'add_fields',
+        'content': 'set_content',
+        'url': 'set_url',
+        'timestamp': 'set_timestamp',
+        'ephemeral': 'set_ephemeral',
+        'reply': 'set_reply',
+        'file': 'add_file',
+        'f': 'add_file',
+        'file_path': 'set_file_path',
+        'f_path': 'set_file_path',
+        'page': 'add_page',
+        'edit': 'edit_message',
+        'create_forum': 'create_forum_thread',
+        'forum_thread': 'create_forum_thread',
+        'forum': 'create_forum_thread',
+        'thread': 'create_thread',
+        'tts': 'set_tts',
+        'sticker': 'add_sticker',
+        'stickers': 'set_stickers',
+        'silent': 'set_silent',
+        'max_embeds': 'set_max_embeds',
+        'parallel': 'set_max_parallel_sends',
+        'max_parallel_sends': 'set_max_parallel_sends',
+        'suppress': 'set_suppress_embeds',
+        'suppress_embeds': 'set_suppress_embeds',
+        'mention_author': 'set_mention_author',
+        'view': 'set_view',
+    }
+
+    # Setters that take several positional arguments; update() unpacks tuples only for these.
+    _multi_arg_setters = frozenset({
+        'set_author', 'set_footer', 'add_field', 'add_page',
+        'create_thread', 'create_forum_thread',
+    })
+
+    def __init__(self, source: Union["commands.Context", discord.Interaction, discord.TextChannel, discord.DMChannel, discord.ForumChannel, discord.Thread, discord.User, discord.Member, discord.Message]):
         self.source = source
         self.message_sender = MessageSender(source)
         self.customizer = EmbedCustomizer(source)
@@ -61,8 +142,10 @@ class EmbedBuilder:
 
         # Advanced properties
         self._max_embeds = 10
+        self._max_parallel_sends = 1
         self._embed_color_gradient = False
         self._timezone_str = 'UTC'
+        self._timezone = get_timezone('UTC')
         self._paginated = False
         self._pages = []
         self._pagination_timeout = 180.0
@@ -74,62 +157,40 @@ class EmbedBuilder:
         self._thread_name = ""
         self._thread_auto_archive_duration = 1440  # 24hrs
         self._thread_reason = None
+        self._created_thread = None
 
         # Forum thread properties
         self._forum_thread_name = ""
         self._forum_thread_content = ""
 
-        self._aliases = {
-            'thumb': 'set_thumbnail',
-            'img': 'set_image',
-            'image': 'set_image',
-            'color': 'set_color',
-            'colour': 'set_color',
-            'set_colour': 'set_color',
-            'title': 'set_title',
-            'desc': 'set_description',
-            'description': 'set_description',
-            'delete_after': 'set_delete_after',
-            'delete': 'set_delete_after',
-            'author': 'set_author',
-            'footer': 'set_footer',
-            'field': 'add_field',
-            'fields': 'add_fields',
-            'content': 'set_content',
-            'url': 'set_url',
-            'timestamp': 'set_timestamp',
-            'ephemeral': 'set_ephemeral',
-            'reply': 'set_reply',
-            'file': 'add_file',
-            'f': 'add_file',
-            'file_path': 'set_file_path',
-            'f_path': 'set_file_path',
-            'page': 'add_page',
-            'edit': 'edit_message',
-            'create_forum': 'create_forum_thread',
-            'forum_thread': 'create_forum_thread',
-            'forum': 'create_forum_thread',
-            'thread': 'create_thread',
-            'tts': 'set_tts',
-            'sticker': 'add_sticker',
-            'stickers': 'set_stickers',
-            'silent': 'set_silent',
-            'max_embeds': 'set_max_embeds',
-            'suppress': 'set_suppress_embeds',
-            'suppress_embeds': 'set_suppress_embeds',
-            'mention_author': 'set_mention_author',
-            'view': 'set_view',
-        }
-
     def __getattr__(self, name):
         if name in self._aliases:
             return getattr(self, self._aliases[name])
         raise AttributeError(
             f"'{self.__class__.__name__}' object has no attribute '{name}'")
 
+    def update(self, **options) -> "EmbedBuilder":
+        """Apply several setters in one call, e.g. update(title="Hi", author=("Name", icon_url)).
+
+        Keys are aliases or setter names without the set_ prefix. Tuples are unpacked as arguments
+        only for author, footer, field, page, thread and forum_thread; any other value is passed as-is.
+        """
+        for key, value in options.items():
+            name = self._aliases.get(key) or f"set_{key}"
+            setter = getattr(self, name)
+            if isinstance(value, tuple) and name in self._multi_arg_setters:
+                setter(*value)
+            else:
+                setter(value)
+        return self
+
     def set_title(self, title: str) -> "EmbedBuilder":
         """Set the embed title."""
-        self._title = str(title)
+        title = str(title)
+        if len(title) > 256:
+            raise ValueError(
+                f"Title length ({len(title)}) exceeds Discord's limit of 256 characters")
+        self._title = title
         return self
 
     def set_description(self, description: str) -> "EmbedBuilder":
@@ -182,27 +243,22 @@ class EmbedBuilder:
 
     def add_field(self, name: str, value: str, inline: bool = False) -> "EmbedBuilder":
         """Add a field to the embed."""
-        self._fields.append((str(name), str(value), inline))
+        self._fields.append(
+            (truncate_text(str(name), 256), truncate_text(str(value), 1024), inline))
         return self
 
     def add_fields(self, fields: List[tuple]) -> "EmbedBuilder":
         """Add multiple fields wiht a tuple"""
-        for field in fields:
-            if len(field) == 2:
-                name, value = field
-                inline = False
-            elif len(field) == 3:
-                name, value, inline = field
-            else:
-                raise ValueError(
-                    f"Field tuple must have 2 or 3 elements, got {len(field)}")
-
-            self._fields.append((str(name), str(value), inline))
+        self._fields.extend(_normalise_fields(fields))
         return self
 
     def set_content(self, content: str) -> "EmbedBuilder":
         """Set the message content (separate from embed)."""
-        self._content = str(content)
+        content = str(content)
+        if len(content) > 2000:
+            raise ValueError(
+                f"Content length ({len(content)}) exceeds Discord's limit of 2000 characters")
+        self._content = content
         return self
 
     def add_file(self, file: discord.File) -> "EmbedBuilder":
@@ -247,9 +303,14 @@ class EmbedBuilder:
         return self
 
     def add_page(self, title: str = "", description: str = "", **kwargs) -> "EmbedBuilder":
-        """Add a custom page for pagination."""
+        """Add a custom page for pagination.
+
+        Page fields are validated here so bad input fails now, not when the page is first shown.
+        """
+        if kwargs.get('fields') is not None:
+            kwargs['fields'] = _normalise_fields(kwargs['fields'])
         page = {
-            "title": title,
+            "title": str(title),
             "description": description,
             **kwargs
         }
@@ -259,6 +320,7 @@ class EmbedBuilder:
     def set_timezone(self, timezone_str: str) -> "EmbedBuilder":
         """Set the timezone for timestamps."""
         self._timezone_str = timezone_str
+        self._timezone = get_timezone(timezone_str)
         return self
 
     def enable_gradient_colors(self, enabled: bool = True) -> "EmbedBuilder":
@@ -271,6 +333,11 @@ class EmbedBuilder:
         self._max_embeds = max_embeds
         return self
 
+    def set_max_parallel_sends(self, max_parallel: int) -> "EmbedBuilder":
+        """Set how many continuation embeds may be sent at once (1 sends them in order)."""
+        self._max_parallel_sends = max(1, int(max_parallel))
+        return self
+
     def set_tts(self, tts: bool = True) -> "EmbedBuilder":
         """Set whether the message should use text-to-speech."""
         self._tts = tts
@@ -309,6 +376,7 @@ class EmbedBuilder:
     def override_user(self, user: Union[discord.Member, discord.User]) -> "EmbedBuilder":
         """Override the user for customization purposes."""
         self._override_user = user
+        self.customizer = EmbedCustomizer(user or self.source)
         return self
 
     def create_forum_thread(self, name: str, content: str = None) -> "EmbedBuilder":
@@ -343,21 +411,18 @@ class EmbedBuilder:
         )
         self.source = thread
         self.message_sender = MessageSender(thread)
+        self.customizer = EmbedCustomizer(self._override_user or thread)
         self._content = ""
 
-    async def _build_page_embed(self, page: dict, index: int) -> discord.Embed:
-        customizer = EmbedCustomizer(self._override_user or self.source)
-
+    def _resolve_page(self, page: dict, index: int, timestamp: datetime.datetime) -> dict:
+        """Resolve a page against the builder state and customisation hooks at send time."""
         page_title = page.get(
             'title', f"{self._title} (Page {index+1}/{len(self._pages)})")
-        page_title = truncate_text(page_title, 256)
-
-        page_description = page.get('description', '')
 
         page_color = page.get('colour', page.get('color', self._color))
 
         (custom_colour, custom_author_name, custom_author_icon,
-         custom_footer_text, custom_footer_icon) = customizer.get_all_custom_values(
+         custom_footer_text, custom_footer_icon) = self.customizer.get_all_custom_values(
             color=page_color,
             author_name=page.get('author_name', self._author_name),
             author_icon_url=page.get('author_icon_url', self._author_icon_url),
@@ -365,59 +430,75 @@ class EmbedBuilder:
             footer_icon_url=page.get('footer_icon_url', self._footer_icon_url)
         )
 
-        embed = discord.Embed(
-            title=page_title,
-            description=page_description,
-            colour=custom_colour,
-            url=page.get('url', self._url if index == 0 else ""),
-            timestamp=self._timestamp or datetime.datetime.now()
-        )
-
+        author = None
         if index == 0 or page.get('author_name'):
             author_name = page.get('author_name', custom_author_name)
             if author_name:
-                embed.set_author(
-                    name=truncate_text(author_name, 256),
-                    icon_url=page.get('author_icon_url',
-                                      custom_author_icon) or None,
-                    url=page.get('author_url', self._author_url) or None
-                )
-
-        if page.get('thumbnail_url'):
-            embed.set_thumbnail(url=page['thumbnail_url'])
-        elif index == 0 and self._thumbnail_url:
-            embed.set_thumbnail(url=self._thumbnail_url)
+                author = (truncate_text(author_name, 256),
+                          page.get('author_icon_url', custom_author_icon) or None,
+                          page.get('author_url', self._author_url) or None)
+
+        thumbnail = page.get('thumbnail_url') or (
+            self._thumbnail_url if index == 0 else "")
 
         if page.get('file_path'):
-            embed.set_image(url=f"attachment://image_{index}.png")
-        elif page.get('image_url'):
-            embed.set_image(url=page['image_url'])
-        elif index == 0 and self._image_url:
-            embed.set_image(url=self._image_url)
-
-        page_fields = page.get('fields', self._fields if index == 0 else None)
-        if page_fields:
-            for name, value, inline in page_fields:
-                embed.add_field(
-                    name=truncate_text(name, 256),
-                    value=truncate_text(value, 1024),
-                    inline=inline
-                )
+            image = f"attachment://image_{index}.png"
+        else:
+            image = page.get('image_url') or (
+                self._image_url if index == 0 else "")
 
+        footer = None
         footer_text = page.get('footer_text', custom_footer_text)
         if footer_text:
-            embed.set_footer(
-                text=truncate_text(footer_text, 2048),
-                icon_url=page.get('footer_icon_url',
-                                  custom_footer_icon) or None
-            )
+            footer = (truncate_text(footer_text, 2048),
+                      page.get('footer_icon_url', custom_footer_icon) or None)
+
+        return {
+            'title': truncate_text(page_title, 256),
+            'description': page.get('description', ''),
+            'colour': custom_colour,
+            'url': page.get('url', self._url if index == 0 else ""),
+            'timestamp': timestamp,
+            'author': author,
+            'thumbnail': thumbnail,
+            'image': image,
+            # Fields are normalised and truncated when they are added.
+            'fields': list(page.get('fields', self._fields if index == 0 else None) or ()),
+            'footer': footer,
+        }
+
+    @staticmethod
+    def _build_page_embed(resolved: dict) -> discord.Embed:
+        embed = discord.Embed(
+            title=resolved['title'],
+            description=resolved['description'],
+            colour=resolved['colour'],
+            url=resolved['url'],
+            timestamp=resolved['timestamp']
+        )
+
+        if resolved['author']:
+            name, icon_url, url = resolved['author']
+            embed.set_author(name=name, icon_url=icon_url, url=url)
+
+        if resolved['thumbnail']:
+            embed.set_thumbnail(url=resolved['thumbnail'])
+
+        if resolved['image']:
+            embed.set_image(url=resolved['image'])
+
+        for name, value, inline in resolved['fields']:
+            embed.add_field(name=name, value=value, inline=inline)
+
+        if resolved['footer']:
+            text, icon_url = resolved['footer']
+            embed.set_footer(text=text, icon_url=icon_url)
 
         return embed
 
     async def build_embed(self, chunk: str = None, index: int = 0, total_chunks: int = 1) -> discord.Embed:
-        customizer = EmbedCustomizer(self._override_user or self.source)
         (custom_colour, custom_author_name, custom_author_icon,
-         custom_footer_text, custom_footer_icon) = customizer.get_all_custom_values(
+         custom_footer_text, custom_footer_icon) = self.customizer.get_all_custom_values(
             color=self._color,
             author_name=self._author_name,
             author_icon_url=self._author_icon_url,
@@ -425,10 +506,11 @@ class EmbedBuilder:
             footer_icon_url=self._footer_icon_url
         )
 
+        # set_title already enforces the 256 limit; only the suffix can exceed it.
         title = self._title
         if total_chunks > 1 and index > 0:
-            title = f"{self._title} (continued {index + 1}/{total_chunks})"
-        title = truncate_text(title, 256)
+            title = truncate_text(
+                f"{self._title} (continued {index + 1}/{total_chunks})", 256)
 
         description = chunk if chunk is not None else self._description
 
@@ -439,11 +521,7 @@ class EmbedBuilder:
         )
 
         if self._timestamp is None:
-            try:
-                tz = timezone(self._timezone_str)
-                timestamp = datetime.datetime.now(tz)
-            except Exception:
-                timestamp = datetime.datetime.now()
+            timestamp = datetime.datetime.now(self._timezone)
         else:
             timestamp = self._timestamp
 
@@ -473,9 +551,8 @@ class EmbedBuilder:
                 embed.set_image(url=self._image_url)
 
         if index == 0 and self._fields:
+            # Fields are truncated once when they are added.
             for name, value, inline in self._fields:
-                name = truncate_text(name, 256)
-                value = truncate_text(value, 1024)
                 embed.add_field(name=name, value=value, inline=inline)
 
         if custom_footer_text:
@@ -486,17 +563,6 @@ class EmbedBuilder:
         return embed
 
     async def send(self) -> List[discord.Message]:
-        if self._author_name and not isinstance(self._author_name, str):
-            raise ValueError("Author name must be a string")
-
-        if len(self._title) > 256:
-            raise ValueError(
-                f"Title length ({len(self._title)}) exceeds Discord's limit of 256 characters")
-
-        if self._content and len(self._content) > 2000:
-            raise ValueError(
-                f"Content length ({len(self._content)}) exceeds Discord's limit of 2000 characters")
-
         if self._file_path and not os.path.exists(self._file_path):
             raise ValueError(f"File not found at path: {self._file_path}")
 
@@ -506,11 +572,14 @@ class EmbedBuilder:
         if isinstance(self.source, discord.ForumChannel):
             await self._setup_forum_thread()
 
-        if len(self._description) <= 4096:
-            chunks = [self._description]
-        else:
-            chunks = chunk_text(
-                self._description, max_chunk_size=4096, max_chunks=self._max_embeds)
+        description = self._description
+        if len(description) <= 4096:
+            if not self._edit_message:
+                return await self._send_single_embed(description)
+            return await self._send_multiple_embeds([description])
+
+        chunks = chunk_text(
+            description, max_chunk_size=4096, max_chunks=self._max_embeds)
 
         if len(chunks) == 1 and not self._edit_message:
             return await self._send_single_embed(chunks[0])
@@ -553,60 +622,99 @@ class EmbedBuilder:
         if self._edit_message:
             try:
                 await self._edit_message.delete()
-            except (discord.Forbidden, discord.NotFound, discord.HTTPException):
+            except _MESSAGE_ERRORS:
                 pass
             self._edit_message = None
 
-        for i, chunk in enumerate(chunks):
-            try:
-                embed = await self.build_embed(chunk, i, len(chunks))
-
-                content = self._content if i == 0 else None
-                files = self._prepare_files() if i == 0 else None
-                view = self._view if i == 0 else None
-                reply = self._reply if i == 0 else False
-
-                message = await self.message_sender.send_message(
-                    embed, content, files, view, reply,
-                    allowed_mentions=self._allowed_mentions, tts=self._tts,
-                    suppress_embeds=self._suppress_embeds, silent=self._silent,
-                    ephemeral=self._ephemeral,
-                    delete_after=self._delete_after if i == 0 else None,
-                    stickers=self._stickers if i == 0 else [],
-                    mention_author=self._mention_author if i == 0 else False
-                )
-
-                messages.append(message)
-
-                if i == 0 and self._create_thread:
-                    thread = await self.message_sender.create_thread_if_needed(
-                        message, self._thread_name, self._thread_auto_archive_duration, self._thread_reason
-                    )
-                    if thread:
-                        self._created_thread = thread
-
-                if i < len(chunks) - 1:
-                    await asyncio.sleep(0.5)
+        if self._max_parallel_sends > 1 and len(chunks) > 1:
+            return await self._send_multiple_embeds_parallel(chunks)
 
+        # Sends stay strictly ordered. The next embed is built inside the
+        # 0.5s gap between sends, and only the remainder of the gap is slept.
+        loop = asyncio.get_running_loop()
+        total = len(chunks)
+        embed = await self.build_embed(chunks[0], 0, total)
+        for i in range(total):
+            try:
+                messages.append(await self._send_chunk(embed, i))
+                pause = 0.5
             except discord.HTTPException as e:
-                logger.error(f"Error sending embed {i+1}/{len(chunks)}: {e}")
+                logger.error(f"Error sending embed {i+1}/{total}: {e}")
                 if not messages:
                     raise
+                pause = 0.0
+
+            if i < total - 1:
+                resume_at = loop.time() + pause
+                embed = await self.build_embed(chunks[i + 1], i + 1, total)
+                remaining = resume_at - loop.time()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
 
         return messages
 
+    async def _send_multiple_embeds_parallel(self, chunks: List[str]) -> List[discord.Message]:
+        # The first message carries the content, files, view and reply, so it
+        # goes out on its own before the continuation embeds are fanned out.
+        first_embed = await self.build_embed(chunks[0], 0, len(chunks))
+        messages = [await self._send_chunk(first_embed, 0)]
+
+        embeds = [await self.build_embed(chunk, i, len(chunks))
+                  for i, chunk in enumerate(chunks[1:], start=1)]
+
+        messages.extend(await self.message_sender.send_multiple_embeds_parallel(
+            embeds, max_parallel=self._max_parallel_sends,
+            allowed_mentions=self._allowed_mentions, tts=self._tts,
+            suppress_embeds=self._suppress_embeds, silent=self._silent,
+            ephemeral=self._ephemeral
+        ))
+
+        return messages
+
+    async def _send_chunk(self, embed: discord.Embed, index: int) -> discord.Message:
+        first = index == 0
+
+        message = await self.message_sender.send_message(
+            embed,
+            self._content if first else None,
+            self._prepare_files() if first else None,
+            self._view if first else None,
+            self._reply if first else False,
+            allowed_mentions=self._allowed_mentions, tts=self._tts,
+            suppress_embeds=self._suppress_embeds, silent=self._silent,
+            ephemeral=self._ephemeral,
+            delete_after=self._delete_after if first else None,
+            stickers=self._stickers if first else [],
+            mention_author=self._mention_author if first else False
+        )
+
+        if first and self._create_thread:
+            thread = await self.message_sender.create_thread_if_needed(
+                message, self._thread_name, self._thread_auto_archive_duration, self._thread_reason
+            )
+            if thread:
+                self._created_thread = thread
+
+        return message
+
     async def _send_paginated(self) -> List[discord.Message]:
         if not self._pages:
             raise ValueError(
                 "Pages list must be provided when paginated is True")
 
-        embeds = []
+        # Every page is resolved against the builder and customisation hooks
+        # now, so later builder changes or hook errors can't leak into button
+        # clicks. Only the discord.Embed construction for pages after the
+        # first is deferred until PaginationView first shows them.
+        timestamp = self._timestamp or datetime.datetime.now()
+        resolved = [self._resolve_page(page, i, timestamp)
+                    for i, page in enumerate(self._pages)]
+        embeds = [self._build_page_embed(resolved[0])]
+        embeds.extend(partial(self._build_page_embed, page)
+                      for page in resolved[1:])
         discord_files = []
 
         for i, page in enumerate(self._pages):
-            embed = await self._build_page_embed(page, i)
-            embeds.append(embed)
-
             if page.get('file_path') and os.path.exists(page['file_path']):
                 discord_files.append(discord.File(
                     page['file_path'], filename=f'image_{i}.png'))
@@ -1,10 +1,18 @@
 import discord
-from discord.ext import commands
-from typing import Union, Tuple
+from typing import Union, Tuple, TYPE_CHECKING
+
+from .utils import is_context
+
+if TYPE_CHECKING:
+    from discord.ext import commands
+
+_USER_TYPES = (discord.User, discord.Member)
 
 
 class EmbedCustomizer:
-    def __init__(self, source: Union[commands.Context, discord.Interaction, discord.TextChannel,
+    __slots__ = ('source', 'default_colour', 'user', 'guild', 'bot')
+
+    def __init__(self, source: Union["commands.Context", discord.Interaction, discord.TextChannel,
                                      discord.DMChannel, discord.User, discord.Member, discord.Message]):
         self.source = source
         self.default_colour = 0x7289DA
@@ -13,7 +21,7 @@ class EmbedCustomizer:
             self.user = source.user
             self.guild = source.guild
             self.bot = getattr(source, 'client', None)
-        elif isinstance(source, commands.Context):
+        elif is_context(source):
             self.user = source.author
             self.guild = source.guild
             self.bot = getattr(source, 'bot', None)
@@ -23,7 +31,7 @@ class EmbedCustomizer:
             self.bot = getattr(source, 'bot', None) or getattr(
                 getattr(source, "_state", None), "_get_client", lambda: None
             )()
-        elif isinstance(source, (discord.User, discord.Member)):
+        elif isinstance(source, _USER_TYPES):
             self.user = source
             self.guild = getattr(source, 'guild', None)
             self.bot = None
@@ -1,50 +1,82 @@
 import discord
-from discord.ext import commands
-from typing import Union, List, Optional
+from typing import Union, List, Optional, TYPE_CHECKING
+import asyncio
 import logging
 
+from .utils import is_context
+
+if TYPE_CHECKING:
+    from discord.ext import commands
+
 logger = logging.getLogger("MessageSender")
 
+# Errors that mean a message could not be edited or deleted in place.
+_MESSAGE_ERRORS = (discord.Forbidden, discord.NotFound, discord.HTTPException)
+
+
+def _interaction_info(source):
+    return True, False, source.channel, source.user
+
+
+def _context_info(source):
+    return False, True, source.channel, source.author
+
+
+def _user_info(source):
+    return False, False, None, source  # Will create DM
+
+
+def _message_info(source):
+    return False, False, source.channel, source.author
+
+
+def _channel_info(source):
+    return False, False, source, None
+
+
+# (is_interaction, is_context, channel, user) resolvers keyed by source type,
+# in the order they are tried for subclasses. commands.Context is matched
+# through is_context() so discord.ext.commands is never imported here.
+_SOURCE_RESOLVERS = {
+    discord.Interaction: _interaction_info,
+    discord.User: _user_info,
+    discord.Member: _user_info,
+    discord.Message: _message_info,
+    discord.TextChannel: _channel_info,
+    discord.DMChannel: _channel_info,
+    discord.Thread: _channel_info,
+    discord.VoiceChannel: _channel_info,
+    discord.ForumChannel: _channel_info,
+}
+
+
+def _resolve_source(source) -> tuple:
+    resolver = _SOURCE_RESOLVERS.get(type(source))
+    if resolver is None and is_context(source):
+        resolver = _context_info
+    if resolver is None:
+        resolver = next((candidate for source_type, candidate in _SOURCE_RESOLVERS.items()
+                         if isinstance(source, source_type)), _channel_info)
+    return resolver(source)
+
 
 class MessageSender:
     """Handles the actual sending of Discord messages with embeds."""
 
-    def __init__(self, source: Union[commands.Context, discord.Interaction, discord.TextChannel, discord.DMChannel, discord.Thread, discord.User, discord.Member, discord.Message]):
+    __slots__ = ('source', 'is_interaction', 'is_context', 'channel', 'user')
+
+    def __init__(self, source: Union["commands.Context", discord.Interaction, discord.TextChannel, discord.DMChannel, discord.Thread, discord.User, discord.Member, discord.Message]):
         self.source = source
         self._setup_source_info()
 
     def _setup_source_info(self):
         """Extract relevant information from the source object."""
-        if isinstance(self.source, discord.Interaction):
-            self.is_interaction = True
-            self.is_context = False
-            self.channel = self.source.channel
-            self.user = self.source.user
-        elif isinstance(self.source, commands.Context):
-            self.is_interaction = False
-            self.is_context = True
-            self.channel = self.source.channel
-            self.user = self.source.author
-        elif isinstance(self.source, (discord.User, discord.Member)):
-            self.is_interaction = False
-            self.is_context = False
-            self.channel = None  # Will create DM
-            self.user = self.source
-        elif isinstance(self.source, discord.Message):
-            self.is_interaction = False
-            self.is_context = False
-            self.channel = self.source.channel
-            self.user = self.source.author
-        else:
-            self.is_interaction = False
-            self.is_context = False
-            self.channel = self.source
-            self.user = None
+        self.is_interaction, self.is_context, self.channel, self.user = _resolve_source(self.source)
 
     async def _prepare_channel(self) -> discord.abc.Messageable:
         """Ensure we have a valid channel to send to."""
         if self.channel is None and self.user:
-            return await self.user.create_dm()
+            self.channel = await self.user.create_dm()
         return self.channel or self.source
 
     def _build_message_options(self, embed: discord.Embed, content: str = None, files: List[discord.File] = None, view: discord.ui.View = None, **kwargs) -> dict:
@@ -91,6 +123,26 @@ class MessageSender:
         else:
             return await channel.send(**options)
 
+    async def send_multiple_embeds_parallel(self, embeds: List[discord.Embed], max_parallel: int = 5, **kwargs) -> List[discord.Message]:
+        """Send several embeds concurrently, at most max_parallel at a time, keeping their order."""
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def send_one(embed: discord.Embed) -> discord.Message:
+            async with semaphore:
+                return await self.send_message(embed, reply=False, **kwargs)
+
+        results = await asyncio.gather(*(send_one(embed) for embed in embeds), return_exceptions=True)
+
+        messages = []
+        for i, result in enumerate(results):
+            if isinstance(result, discord.HTTPException):
+                logger.error(f"Error sending embed {i+1}/{len(embeds)}: {result}")
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                messages.append(result)
+        return messages
+
     async def _send_interaction_message(self, options: dict) -> discord.Message:
         """Handle interaction-specific message sending."""
         if not self.source.response.is_done():
@@ -104,7 +156,7 @@ class MessageSender:
             try:
                 await message.delete()
                 return await self.send_message(embed, content, files, view, reply=False, **kwargs)
-            except (discord.Forbidden, discord.NotFound, discord.HTTPException):
+            except _MESSAGE_ERRORS:
                 return await self.send_message(embed, content, files, view, reply=False, **kwargs)
         else:
             options = self._build_message_options(
@@ -114,7 +166,7 @@ class MessageSender:
             try:
                 await message.edit(**edit_options)
                 return message
-            except (discord.Forbidden, discord.NotFound, discord.HTTPException):
+            except _MESSAGE_ERRORS:
                 return await self.send_message(embed, content, files, view, reply=False, **kwargs)
 
     async def create_thread_if_needed(self, message: discord.Message, thread_name: str, auto_archive_duration: int = 1440, reason: str = None) -> Optional[discord.Thread]:
@@ -1,10 +1,12 @@
 import discord
-from typing import List
+from typing import Callable, List, Union
+
+PageEmbed = Union[discord.Embed, Callable[[], discord.Embed]]
 
 
 class PaginationView(discord.ui.View):
 
-    def __init__(self, embeds: List[discord.Embed], timeout: float = 180.0):
+    def __init__(self, embeds: List[PageEmbed], timeout: float = 180.0):
         super().__init__(timeout=timeout)
         self.embeds = embeds
         self.current_page = 0
@@ -31,8 +33,16 @@ class PaginationView(discord.ui.View):
         button.callback = callback
         return button
 
+    def _get_embed(self, index: int) -> discord.Embed:
+        """Return the page embed, building it the first time if it was deferred."""
+        embed = self.embeds[index]
+        if callable(embed):
+            embed = embed()
+            self.embeds[index] = embed
+        return embed
+
     async def update_buttons(self, interaction: discord.Interaction):
-        embed = self.embeds[self.current_page]
+        embed = self._get_embed(self.current_page)
 
         for child in self.children:
             if isinstance(child, discord.ui.Button):
@@ -62,9 +72,9 @@ class PaginationView(discord.ui.View):
 
     @property
     def current_embed(self) -> discord.Embed:
-        return self.embeds[self.current_page]
+        return self._get_embed(self.current_page)
 
-    def add_page(self, embed: discord.Embed):
+    def add_page(self, embed: PageEmbed):
         self.embeds.append(embed)
         self.total_pages = len(self.embeds)
 
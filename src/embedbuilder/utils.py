@@ -1,4 +1,12 @@
-from typing import List
+import datetime
+import re
+import sys
+from functools import lru_cache
+from typing import List, Optional
+
+import pytz
+
+_LEADING_WHITESPACE = re.compile(r'\s*')
 
 
 def chunk_text(description: str, max_chunk_size: int = 4096, max_chunks: int = 10) -> List[str]:
@@ -38,37 +46,32 @@ def _smart_chunk(text: str, max_chunk_size: int, max_chunks: int) -> List[str]:
             chunks.append(text[pos:].rstrip())
             break
 
-        chunk_text = text[pos:end_pos]
-        split_pos = _find_best_split(chunk_text, max_chunk_size)
-
-        actual_end = pos + split_pos
+        actual_end = pos + _find_best_split(text, pos, end_pos, max_chunk_size)
         chunks.append(text[pos:actual_end].rstrip())
 
-        pos = actual_end
-        while pos < len(text) and text[pos].isspace():
-            pos += 1
+        pos = _LEADING_WHITESPACE.match(text, actual_end).end()
 
     return chunks
 
 
-def _find_best_split(chunk: str, max_size: int) -> int:
-    min_split_pos = max_size // 3
+def _find_best_split(text: str, start: int, end: int, max_size: int) -> int:
+    min_split_pos = start + max_size // 3
 
-    last_para = chunk.rfind('\n\n')
+    last_para = text.rfind('\n\n', start, end)
     if last_para > min_split_pos:
-        return last_para + 2
+        return last_para + 2 - start
 
-    last_sentence = chunk.rfind('. ')
+    last_sentence = text.rfind('. ', start, end)
     if last_sentence > min_split_pos:
-        return last_sentence + 2
+        return last_sentence + 2 - start
 
-    last_line = chunk.rfind('\n')
+    last_line = text.rfind('\n', start, end)
     if last_line > min_split_pos:
-        return last_line + 1
+        return last_line + 1 - start
 
-    last_space = chunk.rfind(' ')
+    last_space = text.rfind(' ', start, end)
     if last_space > min_split_pos:
-        return last_space + 1
+        return last_space + 1 - start
 
     return max_size
 
@@ -77,3 +80,22 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     if not text or len(text) <= max_length:
         return text
     return text[:max_length - len(suffix)] + suffix
+
+
+@lru_cache(maxsize=64)
+def get_timezone(timezone_str: str) -> Optional[datetime.tzinfo]:
+    """Resolve a timezone name once; unknown names give None (naive local time)."""
+    try:
+        return pytz.timezone(timezone_str)
+    except Exception:
+        return None
+
+
+def is_context(source) -> bool:
+    """isinstance(source, commands.Context) without importing discord.ext.commands.
+
+    A Context can only exist once the bot has imported the commands extension,
+    so apps that only use interactions never pay for that import.
+    """
+    commands = sys.modules.get("discord.ext.commands")
+    return commands is not None and isinstance(source, commands.Context)
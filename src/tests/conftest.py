@@ -2,6 +2,8 @@ import pytest
 import asyncio
 import tempfile
 import os
+import sys
+from types import SimpleNamespace
 from unittest.mock import MagicMock, AsyncMock
 import discord
 from discord.ext import commands
@@ -14,22 +16,26 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
 @pytest.fixture
 def mock_bot():
-    bot = MagicMock(spec=commands.Bot)
-    bot.user = MagicMock(spec=discord.ClientUser)
-    bot.user.id = 98765
-    bot.user.name = "TestBot"
-    return bot
+    return SimpleNamespace(user=SimpleNamespace(id=98765, name="TestBot"))
 
 
 @pytest.fixture
 def mock_guild():
-    guild = MagicMock(spec=discord.Guild)
-    guild.id = 67890
-    guild.name = "Test Guild"
-    guild.icon = None
-    return guild
+    return SimpleNamespace(id=67890, name="Test Guild", icon=None)
 
 
 @pytest.fixture
@@ -89,9 +95,26 @@ def mock_forum_channel():
     return channel
 
 
+def spec_mock(spec_names, spec_class):
+    """MagicMock restricted to spec_names that still passes isinstance(mock, spec_class)."""
+    mock = MagicMock(spec=spec_names)
+    mock.__class__ = spec_class
+    return mock
+
+
+@pytest.fixture(scope="session")
+def _context_spec():
+    return dir(commands.Context)
+
+
+@pytest.fixture(scope="session")
+def _interaction_spec():
+    return dir(discord.Interaction)
+
+
 @pytest.fixture
-def mock_context(mock_bot, mock_member, mock_channel, mock_guild):
-    ctx = MagicMock(spec=commands.Context)
+def mock_context(mock_bot, mock_member, mock_channel, mock_guild, _context_spec):
+    ctx = spec_mock(_context_spec, commands.Context)
     ctx.bot = mock_bot
     ctx.author = mock_member
     ctx.channel = mock_channel
@@ -104,8 +127,8 @@ def mock_context(mock_bot, mock_member, mock_channel, mock_guild):
 
 
 @pytest.fixture
-def mock_interaction(mock_member, mock_channel, mock_guild):
-    interaction = MagicMock(spec=discord.Interaction)
+def mock_interaction(mock_member, mock_channel, mock_guild, _interaction_spec):
+    interaction = spec_mock(_interaction_spec, discord.Interaction)
     interaction.user = mock_member
     interaction.channel = mock_channel
     interaction.guild = mock_guild
@@ -119,6 +142,49 @@ def mock_interaction(mock_member, mock_channel, mock_guild):
     return interaction
 
 
+@pytest.fixture
+def ctx_factory(_context_spec):
+    """Builds standalone Context mocks (own author/guild/channel) on the cached spec."""
+    def _build_ctx():
+        ctx = spec_mock(_context_spec, commands.Context)
+        ctx.author = MagicMock(spec=discord.Member)
+        ctx.author.id = 12345
+        ctx.guild = MagicMock(spec=discord.Guild)
+        ctx.guild.id = 67890
+        ctx.channel = MagicMock(spec=discord.TextChannel)
+        ctx.reply = AsyncMock()
+        ctx.send = AsyncMock()
+        return ctx
+    return _build_ctx
+
+
+@pytest.fixture
+def interaction_factory(_interaction_spec):
+    """Builds standalone Interaction mocks on the cached spec."""
+    def _build_interaction():
+        interaction = spec_mock(_interaction_spec, discord.Interaction)
+        interaction.user = MagicMock(spec=discord.Member)
+        interaction.user.id = 12345
+        interaction.user.color = discord.Colour.default()
+        interaction.user.display_avatar = MagicMock()
+        interaction.user.display_avatar.url = "https://example.com/avatar.png"
+        interaction.guild = MagicMock(spec=discord.Guild)
+        interaction.guild.id = 67890
+        interaction.guild.me = MagicMock(spec=discord.Member)
+        interaction.channel = MagicMock(spec=discord.TextChannel)
+        interaction.response = MagicMock()
+        interaction.response.is_done.return_value = False
+        interaction.response.send_message = AsyncMock()
+        interaction.original_response = AsyncMock()
+        interaction.followup = MagicMock()
+        interaction.followup.send = AsyncMock()
+        interaction.client = MagicMock()
+        interaction.client.get_embed_colour = MagicMock(
+            return_value=discord.Colour.blue())
+        return interaction
+    return _build_interaction
+
+
 @pytest.fixture
 def mock_message(mock_member, mock_channel):
     message = MagicMock(spec=discord.Message)
@@ -183,6 +249,16 @@ def very_long_text():
     return "A" * 10000
 
 
+@pytest.fixture(scope="session")
+def large_word_blob():
+    return "Word " * (1024 * 100)
+
+
+@pytest.fixture(scope="session")
+def one_mib_text() -> str:
+    return "B" * (1024 * 1024)
+
+
 @pytest.fixture
 def mock_discord_file():
     file = MagicMock(spec=discord.File)
@@ -190,6 +266,12 @@ def mock_discord_file():
     return file
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="run tests marked as slow (performance/stress)")
+
+
 def pytest_configure(config):
     config.addinivalue_line("markers", "unit: mark test as a unit test")
     config.addinivalue_line(
@@ -199,6 +281,17 @@ def pytest_configure(config):
         "markers", "discord: mark test as Discord API related")
 
 
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    selected, deselected = [], []
+    for item in items:
+        (deselected if "slow" in item.keywords else selected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
 def assert_embed_equal(embed1, embed2):
     assert embed1.title == embed2.title
     assert embed1.description == embed2.description
@@ -1,3 +1,4 @@
+import os
 import pytest
 import discord
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -5,8 +6,9 @@ from discord.ext import commands
 
 from embedbuilder.core import EmbedBuilder
 from embedbuilder.customization import EmbedCustomizer
+from embedbuilder.messagesender import MessageSender
 from embedbuilder.pagination import PaginationView
-from embedbuilder.utils import truncate_text, chunk_text
+from embedbuilder.utils import truncate_text, chunk_text, is_context, get_timezone
 
 
 class TestUtils:
@@ -42,6 +44,11 @@ class TestUtils:
         chunks = chunk_text(text, max_chunk_size=50)
         assert len(chunks) >= 1
 
+    def test_chunk_text_splits_on_paragraph_boundary(self):
+        text = "A" * 30 + "\n\n   \n" + "B" * 30
+        chunks = chunk_text(text, max_chunk_size=50)
+        assert chunks == ["A" * 30, "B" * 30]
+
     def test_chunk_text_empty_raises_error(self):
         with pytest.raises(ValueError, match="Description cannot be empty"):
             chunk_text("")
@@ -52,39 +59,28 @@ class TestUtils:
         assert len(chunks) <= 3
 
 
+    def test_get_timezone(self):
+        tz = get_timezone("America/New_York")
+        assert tz.zone == "America/New_York"
+        assert get_timezone("America/New_York") is tz
+        assert get_timezone("Not/AZone") is None
+
+    def test_is_context(self):
+        assert is_context(MagicMock(spec=commands.Context))
+        assert not is_context(MagicMock(spec=discord.Interaction))
+        assert not is_context(None)
+
+
 class TestEmbedCustomizer:
     @pytest.fixture
-    def mock_context(self):
-        ctx = MagicMock(spec=commands.Context)
-        ctx.author = MagicMock(spec=discord.Member)
-        ctx.author.id = 12345
-        ctx.guild = MagicMock(spec=discord.Guild)
-        ctx.guild.id = 67890
+    def mock_context(self, ctx_factory):
+        ctx = ctx_factory()
         ctx.bot = None
         return ctx
 
     @pytest.fixture
-    def mock_interaction(self):
-        interaction = MagicMock(spec=discord.Interaction)
-        interaction.user = MagicMock(spec=discord.Member)
-        interaction.user.id = 12345
-        interaction.user.color = discord.Colour.default()
-        interaction.user.display_avatar = MagicMock()
-        interaction.user.display_avatar.url = "https://example.com/avatar.png"
-        interaction.guild = MagicMock(spec=discord.Guild)
-        interaction.guild.id = 67890
-        interaction.guild.me = MagicMock(spec=discord.Member)
-        interaction.channel = MagicMock(spec=discord.TextChannel)
-        interaction.response = MagicMock()
-        interaction.response.is_done.return_value = False
-        interaction.response.send_message = AsyncMock()
-        interaction.original_response = AsyncMock()
-        interaction.followup = MagicMock()
-        interaction.followup.send = AsyncMock()
-        interaction.client = MagicMock()
-        interaction.client.get_embed_colour = MagicMock(
-            return_value=discord.Colour.blue())
-        return interaction
+    def mock_interaction(self, interaction_factory):
+        return interaction_factory()
 
     def test_customizer_with_context(self, mock_context):
         customizer = EmbedCustomizer(mock_context)
@@ -126,6 +122,46 @@ class TestEmbedCustomizer:
         assert values[1] == ""
 
 
+class TestMessageSender:
+    def test_context_subclass_source(self):
+        class CustomContext(commands.Context):
+            pass
+
+        ctx = CustomContext.__new__(CustomContext)
+        ctx.channel = MagicMock(spec=discord.TextChannel)
+        ctx.author = MagicMock(spec=discord.Member)
+
+        sender = MessageSender(ctx)
+
+        assert sender.is_context is True
+        assert sender.is_interaction is False
+        assert sender.channel is ctx.channel
+        assert sender.user is ctx.author
+
+    def test_channel_source(self):
+        channel = MagicMock(spec=discord.TextChannel)
+
+        sender = MessageSender(channel)
+
+        assert sender.is_context is False
+        assert sender.channel is channel
+        assert sender.user is None
+
+    @pytest.mark.parametrize("channel_type", [
+        discord.TextChannel, discord.DMChannel, discord.Thread,
+        discord.VoiceChannel, discord.ForumChannel,
+    ])
+    def test_exact_channel_types_skip_context_check(self, channel_type):
+        channel = channel_type.__new__(channel_type)
+
+        with patch('embedbuilder.messagesender.is_context') as mock_is_context:
+            sender = MessageSender(channel)
+
+        mock_is_context.assert_not_called()
+        assert sender.channel is channel
+        assert sender.user is None
+
+
 class TestPaginationView:
     @pytest.fixture
     def sample_embeds(self):
@@ -191,41 +227,40 @@ class TestPaginationView:
         assert view.current_page == 0
 
 
+    @pytest.mark.asyncio
+    async def test_deferred_page_built_once(self, sample_embeds):
+        deferred = MagicMock(return_value=sample_embeds[1])
+        view = PaginationView([sample_embeds[0], deferred])
+        mock_interaction = AsyncMock(spec=discord.Interaction)
+        mock_interaction.response.edit_message = AsyncMock()
+
+        await view.next_page_callback(mock_interaction)
+        await view.prev_page_callback(mock_interaction)
+        await view.next_page_callback(mock_interaction)
+
+        deferred.assert_called_once()
+        assert view.embeds[1] is sample_embeds[1]
+        assert view.current_embed is sample_embeds[1]
+
+    @pytest.mark.asyncio
+    async def test_current_embed_builds_deferred_page(self, sample_embeds):
+        deferred = MagicMock(return_value=sample_embeds[1])
+        view = PaginationView([sample_embeds[0], deferred])
+        view.current_page = 1
+
+        assert view.current_embed is sample_embeds[1]
+        assert view.current_embed is sample_embeds[1]
+        deferred.assert_called_once()
+
+
 class TestEmbedBuilder:
     @pytest.fixture
-    def mock_context(self):
-        ctx = MagicMock(spec=commands.Context)
-        ctx.author = MagicMock(spec=discord.Member)
-        ctx.author.id = 12345
-        ctx.guild = MagicMock(spec=discord.Guild)
-        ctx.guild.id = 67890
-        ctx.channel = MagicMock(spec=discord.TextChannel)
-        ctx.reply = AsyncMock()
-        ctx.send = AsyncMock()
-        return ctx
+    def mock_context(self, ctx_factory):
+        return ctx_factory()
 
     @pytest.fixture
-    def mock_interaction(self):
-        interaction = MagicMock(spec=discord.Interaction)
-        interaction.user = MagicMock(spec=discord.Member)
-        interaction.user.id = 12345
-        interaction.user.color = discord.Colour.default()
-        interaction.user.display_avatar = MagicMock()
-        interaction.user.display_avatar.url = "https://example.com/avatar.png"
-        interaction.guild = MagicMock(spec=discord.Guild)
-        interaction.guild.id = 67890
-        interaction.guild.me = MagicMock(spec=discord.Member)
-        interaction.channel = MagicMock(spec=discord.TextChannel)
-        interaction.response = MagicMock()
-        interaction.response.is_done.return_value = False
-        interaction.response.send_message = AsyncMock()
-        interaction.original_response = AsyncMock()
-        interaction.followup = MagicMock()
-        interaction.followup.send = AsyncMock()
-        interaction.client = MagicMock()
-        interaction.client.get_embed_colour = MagicMock(
-            return_value=discord.Colour.blue())
-        return interaction
+    def mock_interaction(self, interaction_factory):
+        return interaction_factory()
 
     def test_embedbuilder_initialization(self, mock_context):
         builder = EmbedBuilder(mock_context)
@@ -233,6 +268,14 @@ class TestEmbedBuilder:
         assert hasattr(builder, 'customizer')
         assert builder._reply == True
 
+    def test_embedbuilder_has_no_instance_dict(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+        assert not hasattr(builder, '__dict__')
+        with pytest.raises(AttributeError):
+            builder.custom_attr = "value"
+        for slot in EmbedBuilder.__slots__:
+            getattr(builder, slot)
+
     def test_method_chaining(self, mock_context):
         builder = EmbedBuilder(mock_context)
         result = (builder
@@ -252,6 +295,51 @@ class TestEmbedBuilder:
 
         assert result is builder
 
+    def test_update_applies_setters(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+
+        result = builder.update(
+            title="Test",
+            desc="Description",
+            color=discord.Color.red(),
+            author=("Author", "https://example.com/icon.png"),
+            field=("Name", "Value", True),
+            timezone="UTC")
+
+        assert result is builder
+        assert builder._title == "Test"
+        assert builder._description == "Description"
+        assert builder._color == discord.Color.red()
+        assert builder._author_name == "Author"
+        assert builder._author_icon_url == "https://example.com/icon.png"
+        assert builder._fields == [("Name", "Value", True)]
+        assert builder._timezone_str == "UTC"
+
+    def test_update_unpacks_page_tuple(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+
+        builder.update(page=("Title", "Desc"))
+
+        assert builder._pages[0]['title'] == "Title"
+        assert builder._pages[0]['description'] == "Desc"
+
+    def test_update_passes_collection_values_whole(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+        stickers = (MagicMock(spec=discord.Sticker), MagicMock(spec=discord.Sticker))
+
+        builder.update(fields=(("a", "b"), ("c", "d", True)), stickers=stickers)
+
+        assert builder._fields == [("a", "b", False), ("c", "d", True)]
+        assert list(builder._stickers) == list(stickers)
+
+    def test_update_validates_and_rejects_unknown_keys(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+
+        with pytest.raises(ValueError, match="Title length"):
+            builder.update(title="x" * 300)
+        with pytest.raises(AttributeError):
+            builder.update(not_a_setting=1)
+
     def test_add_field(self, mock_context):
         builder = EmbedBuilder(mock_context)
         result = builder.add_field("Field 1", "Value 1", True)
@@ -266,18 +354,49 @@ class TestEmbedBuilder:
         ]
         result = builder.add_fields(fields)
         assert result is builder
+        assert builder._fields == [
+            ("Field 1", "Value 1", True),
+            ("Field 2", "Value 2", False),
+            ("Field 3", "Value 3", False)
+        ]
+
+    def test_add_fields_accepts_generator(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+
+        builder.add_fields((f"n{i}", f"v{i}") for i in range(3))
+        builder.add_fields(iter([("a", "b", True)]))
+
+        assert builder._fields == [
+            ("n0", "v0", False), ("n1", "v1", False), ("n2", "v2", False),
+            ("a", "b", True),
+        ]
+
+    def test_add_field_truncates_once(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+        builder.add_field("N" * 300, "V" * 2000)
+        builder.add_fields([("N" * 300, "V" * 2000)])
+
+        for name, value, _ in builder._fields:
+            assert len(name) == 256 and name.endswith("...")
+            assert len(value) == 1024 and value.endswith("...")
 
     def test_add_fields_invalid_tuple(self, mock_context):
         builder = EmbedBuilder(mock_context)
         with pytest.raises(ValueError, match="Field tuple must have 2 or 3 elements"):
             builder.add_fields([("Field 1",)])
 
+    def test_add_fields_invalid_tuple_adds_nothing(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+        with pytest.raises(ValueError):
+            builder.add_fields([("Field 1", "Value 1"), ("Field 2",)])
+        assert builder._fields == []
+
     @pytest.mark.asyncio
     async def test_embedbuilder_debug(self, mock_context):
         builder = EmbedBuilder(mock_context)
 
         print(f"Builder type: {type(builder)}")
-        print(f"Builder __dict__: {builder.__dict__}")
+        print(f"Builder slots: {dict((name, getattr(builder, name, None)) for name in EmbedBuilder.__slots__)}")
 
         try:
             title = getattr(builder, '_title', 'NOT_FOUND')
@@ -318,6 +437,23 @@ class TestEmbedBuilder:
         messages = await builder.send()
         assert len(messages) == 1
 
+    @pytest.mark.asyncio
+    async def test_build_embed_continued_title_truncated(self, mock_context):
+        builder = EmbedBuilder(mock_context).set_title("T" * 256)
+
+        first = await builder.build_embed("Chunk 1", 0, 2)
+        second = await builder.build_embed("Chunk 2", 1, 2)
+
+        assert first.title == "T" * 256
+        assert len(second.title) == 256
+        assert second.title.endswith("...")
+
+    @pytest.mark.asyncio
+    async def test_build_embed_uses_timezone(self, mock_context):
+        builder = EmbedBuilder(mock_context).set_timezone("Asia/Tokyo")
+        embed = await builder.build_embed()
+        assert embed.timestamp.utcoffset().total_seconds() == 9 * 3600
+
     def test_pagination_setup(self, mock_context):
         builder = EmbedBuilder(mock_context)
         result = builder.enable_pagination(timeout=300.0)
@@ -344,6 +480,21 @@ class TestEmbedBuilder:
             "Test Thread", auto_archive_duration=60, reason="Testing")
         assert result is builder
 
+    @pytest.mark.asyncio
+    async def test_created_thread_is_recorded(self, mock_context):
+        mock_thread = MagicMock(spec=discord.Thread)
+        mock_message = MagicMock(spec=discord.Message)
+        mock_message.channel = MagicMock(spec=discord.TextChannel)
+        mock_message.create_thread = AsyncMock(return_value=mock_thread)
+        mock_context.reply.return_value = mock_message
+
+        builder = EmbedBuilder(mock_context).set_author("Author")
+        assert builder._created_thread is None
+
+        await builder.create_thread("Test Thread").send()
+
+        assert builder._created_thread is mock_thread
+
     def test_forum_thread_setup(self, mock_context):
         builder = EmbedBuilder(mock_context)
         result = builder.create_forum_thread("Forum Thread", "Content")
@@ -354,9 +505,11 @@ class TestEmbedBuilder:
         builder = EmbedBuilder(mock_context)
 
         builder.set_author("Valid Author")
-        builder.set_title("A" * 300)
-        with pytest.raises(ValueError):
-            await builder.send()
+        with pytest.raises(ValueError, match="Title length"):
+            builder.set_title("A" * 300)
+
+        with pytest.raises(ValueError, match="Content length"):
+            builder.set_content("A" * 2001)
 
     @pytest.mark.asyncio
     async def test_send_file_not_found(self, mock_context):
@@ -367,6 +520,17 @@ class TestEmbedBuilder:
         with pytest.raises(ValueError):
             await builder.send()
 
+    @pytest.mark.asyncio
+    async def test_file_path_rechecked_every_send(self, mock_context, temp_image_file):
+        builder = EmbedBuilder(mock_context)
+        builder.set_author("Valid Author").set_file_path(temp_image_file)
+
+        await builder.send()
+        os.unlink(temp_image_file)
+
+        with pytest.raises(ValueError, match="File not found at path"):
+            await builder.send()
+
     @pytest.mark.asyncio
     @patch('os.path.exists', return_value=True)
     async def test_send_single_embed_context(self, mock_exists, mock_context):
@@ -415,6 +579,108 @@ class TestEmbedBuilder:
 
             assert len(messages) == 2
 
+    @pytest.mark.asyncio
+    async def test_send_multiple_embeds_keeps_sent_on_error(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+        builder.set_author("Test Author")
+        builder.set_title("Test").set_description("A" * 5000)
+
+        first_message = MagicMock(spec=discord.Message)
+        mock_context.reply.return_value = first_message
+        mock_context.channel.send = AsyncMock(side_effect=discord.HTTPException(
+            MagicMock(status=500, reason="Server Error"), "boom"))
+
+        with patch('embedbuilder.core.chunk_text') as mock_chunk:
+            mock_chunk.return_value = ["Chunk 1", "Chunk 2"]
+
+            messages = await builder.send()
+
+        assert messages == [first_message]
+        mock_context.channel.send.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_send_multiple_embeds_builds_next_during_pause(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+        builder.set_author("Test Author")
+        builder.set_title("Test").set_description("A" * 5000)
+
+        events = []
+        build_embed = builder.build_embed
+
+        async def record_build(chunk, index, total):
+            events.append(f"build {chunk}")
+            return await build_embed(chunk, index, total)
+
+        async def record_send(**kwargs):
+            events.append(f"send {kwargs['embed'].description}")
+            return MagicMock(spec=discord.Message)
+
+        async def record_sleep(delay):
+            events.append("sleep")
+
+        mock_context.reply = AsyncMock(side_effect=record_send)
+        mock_context.channel.send = AsyncMock(side_effect=record_send)
+
+        with patch('embedbuilder.core.chunk_text') as mock_chunk, \
+                patch.object(EmbedBuilder, 'build_embed', side_effect=record_build), \
+                patch('embedbuilder.core.asyncio.sleep', side_effect=record_sleep):
+            mock_chunk.return_value = ["c1", "c2", "c3"]
+
+            messages = await builder.send()
+
+        assert len(messages) == 3
+        assert events == [
+            "build c1", "send c1",
+            "build c2", "sleep", "send c2",
+            "build c3", "sleep", "send c3",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_send_multiple_embeds_build_error_propagates(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+        builder.set_author("Test Author")
+        builder.set_title("Test").set_description("A" * 5000)
+
+        build_embed = builder.build_embed
+
+        async def failing_build(chunk, index, total):
+            if index == 1:
+                raise RuntimeError("customisation hook failed")
+            return await build_embed(chunk, index, total)
+
+        mock_context.reply.return_value = MagicMock(spec=discord.Message)
+
+        with patch('embedbuilder.core.chunk_text') as mock_chunk, \
+                patch.object(EmbedBuilder, 'build_embed', side_effect=failing_build):
+            mock_chunk.return_value = ["c1", "c2", "c3"]
+
+            with pytest.raises(RuntimeError, match="customisation hook"):
+                await builder.send()
+
+        mock_context.reply.assert_awaited_once()
+        mock_context.channel.send.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_send_multiple_embeds_parallel(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+        builder.set_author("Test Author")
+        builder.set_title("Test").set_description("A" * 5000)
+        builder.set_max_parallel_sends(3)
+
+        first_message = MagicMock(spec=discord.Message)
+        mock_context.reply.return_value = first_message
+        mock_context.channel.send = AsyncMock(
+            side_effect=lambda **kwargs: kwargs["embed"].description)
+
+        with patch('embedbuilder.core.chunk_text') as mock_chunk:
+            mock_chunk.return_value = ["Chunk 1", "Chunk 2", "Chunk 3", "Chunk 4"]
+
+            messages = await builder.send()
+
+        assert messages == [first_message, "Chunk 2", "Chunk 3", "Chunk 4"]
+        mock_context.reply.assert_called_once()
+        assert mock_context.channel.send.call_count == 3
+
     @pytest.mark.asyncio
     async def test_send_paginated(self, mock_context):
         builder = EmbedBuilder(mock_context)
@@ -435,6 +701,98 @@ class TestEmbedBuilder:
             assert len(messages) == 1
             mock_context.reply.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_dm_channel_reused_across_sends(self, mock_user):
+        dm_channel = MagicMock(spec=discord.DMChannel)
+        dm_channel.send = AsyncMock()
+        mock_user.create_dm.return_value = dm_channel
+
+        builder = EmbedBuilder(mock_user).set_author("Test Author")
+        await builder.send()
+        await builder.send()
+
+        mock_user.create_dm.assert_awaited_once()
+        assert dm_channel.send.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_override_user_is_chainable(self, mock_context, mock_member):
+        builder = EmbedBuilder(mock_context)
+
+        result = builder.override_user(mock_member).set_author("Test Author")
+
+        assert result is builder
+        assert builder._override_user is mock_member
+        messages = await builder.send()
+        assert len(messages) == 1
+
+    def test_override_user_rebuilds_customizer(self, mock_context, mock_member):
+        builder = EmbedBuilder(mock_context)
+        original = builder.customizer
+
+        builder.override_user(mock_member)
+
+        assert builder.customizer is not original
+        assert builder.customizer.user is mock_member
+
+    @pytest.mark.asyncio
+    async def test_send_paginated_defers_later_pages(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+        builder.set_author("Test Author").enable_pagination()
+        builder.add_page("Page 1", "Content 1")
+        builder.add_page("Page 2", "Content 2")
+
+        await builder.send()
+
+        view = mock_context.reply.call_args.kwargs['view']
+        assert isinstance(view.embeds[0], discord.Embed)
+        assert callable(view.embeds[1])
+        assert view.current_embed.title == "Page 1"
+        view.current_page = 1
+        assert view.current_embed.title == "Page 2"
+
+    @pytest.mark.asyncio
+    async def test_send_paginated_snapshots_state_at_send(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+        builder.set_author("Test Author").set_color(0x00ff00).enable_pagination()
+        builder.add_page("Page 1", "Content 1")
+        builder.add_page("Page 2", "Content 2")
+
+        with patch.object(EmbedCustomizer, 'get_all_custom_values', autospec=True,
+                          side_effect=EmbedCustomizer.get_all_custom_values) as hook:
+            await builder.send()
+            assert hook.call_count == 2
+
+            builder.set_color(0xff0000)
+            view = mock_context.reply.call_args.kwargs['view']
+            view.current_page = 1
+            page_two = view.current_embed
+
+            assert hook.call_count == 2
+
+        assert page_two.colour.value == 0x00ff00
+        assert page_two.timestamp == view.embeds[0].timestamp
+
+    def test_add_page_rejects_bad_fields(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+
+        with pytest.raises(ValueError, match="2 or 3 elements"):
+            builder.add_page("Page 1", "Content 1", fields=[("only",)])
+
+    def test_add_page_accepts_field_generator(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+        builder.add_page("Page 1", "Content 1", fields=((f"n{i}", "v") for i in range(2)))
+
+        assert builder._pages[0]['fields'] == [("n0", "v", False), ("n1", "v", False)]
+
+    def test_add_page_normalises_fields(self, mock_context):
+        builder = EmbedBuilder(mock_context)
+        builder.add_page("Page 1", "Content 1", fields=[("N" * 300, "V")])
+
+        name, value, inline = builder._pages[0]['fields'][0]
+        assert len(name) == 256
+        assert value == "V"
+        assert inline is False
+
     def test_edit_message_setup(self, mock_context):
         mock_message = MagicMock(spec=discord.Message)
         builder = EmbedBuilder(mock_context)
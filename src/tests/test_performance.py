@@ -1,103 +1,140 @@
 import pytest
 import time
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 import discord
+from discord.ext import commands
 from embedbuilder.core import EmbedBuilder
 from embedbuilder.utils import truncate_text, chunk_text
-import inspect
+
+
+# Enough iterations to get past PyPy's JIT threshold (~1000 loops) and
+# CPython's adaptive specialization before anything is timed.
+WARMUP_ITERATIONS = 3000
+
+UNICODE_TEXT = "testðŸŽ‰testðŸš€" * 50
+
+MARKDOWN_TEXT = """
+        # Header
+        **Bold** and *italic*
+        `code`
+        > Quote
+        - List item
+        """ * 100
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _jit_warm():
+    ctx = MagicMock(spec=commands.Context)
+    color = discord.Color.blue()
+    for _ in range(WARMUP_ITERATIONS):
+        (EmbedBuilder(ctx)
+         .set_title("Title")
+         .set_description("Description")
+         .set_color(color)
+         .set_url("https://example.com")
+         .set_author("Author", "https://example.com/icon.png")
+         .set_footer("Footer", "https://example.com/footer.png")
+         .set_thumbnail("https://example.com/thumb.png")
+         .set_image("https://example.com/image.png")
+         .add_field("F1", "V1", True)
+         .set_content("Content")
+         .set_reply(True)
+         .set_ephemeral(False)
+         .enable_pagination()
+         .set_timezone('UTC'))
+
+
+def assert_stat_below(benchmark, stat, limit):
+    # stats is None when benchmarking is disabled (--benchmark-disable, xdist).
+    if benchmark.stats is not None:
+        assert benchmark.stats[stat] < limit
 
 
 class TestPerformance:
     @pytest.mark.slow
-    def test_chunk_text_performance_large_input(self):
-        print("Function source:")
-        print(inspect.getsource(chunk_text))
-        large_text = "Word " * (1024 * 100)
+    def test_chunk_text_performance_large_input(self, large_word_blob, benchmark):
+        chunks = benchmark.pedantic(
+            chunk_text, args=(large_word_blob,),
+            kwargs={'max_chunk_size': 4096, 'max_chunks': 50},
+            iterations=5, rounds=20)
 
-        start_time = time.time()
-        chunks = chunk_text(large_text, max_chunk_size=4096, max_chunks=50)
-        end_time = time.time()
-
-        assert end_time - start_time < 5.0
+        assert_stat_below(benchmark, 'median', 0.05)
         assert len(chunks) <= 50
         assert all(len(chunk) <= 4096 for chunk in chunks)
 
     @pytest.mark.slow
-    def test_truncate_text_performance(self):
-        very_long_text = "B" * (1024 * 1024)
-
-        start_time = time.time()
-        for _ in range(1000):
-            result = truncate_text(very_long_text, 100)
-        end_time = time.time()
+    def test_truncate_text_performance(self, one_mib_text, benchmark):
+        result = benchmark(truncate_text, one_mib_text, 100)
 
-        assert end_time - start_time < 2.0
+        assert_stat_below(benchmark, 'median', 2.0 / 1000)
         assert len(result) <= 100
 
     @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_many_embeds_creation_performance(self, mock_context):
-        mock_messages = []
-        for i in range(100):
-            mock_message = MagicMock(spec=discord.Message)
-            mock_messages.append(mock_message)
+        mock_message = MagicMock(spec=discord.Message)
+        mock_context.reply = AsyncMock(return_value=mock_message)
 
-        mock_context.reply = AsyncMock(side_effect=mock_messages)
+        semaphore = asyncio.Semaphore(16)
 
-        start_time = time.time()
+        async def send_one(i):
+            async with semaphore:
+                builder = EmbedBuilder(mock_context)
+                builder.set_author("Test Author")
+                builder.set_description(f"Test description {i}")
+                return await builder.send()
 
-        for i in range(100):
-            builder = EmbedBuilder(mock_context)
-            builder.set_author("Test Author")
-            builder.set_description(f"Test description {i}")
+        start_time = time.perf_counter()
+        results = await asyncio.gather(*(send_one(i) for i in range(100)))
+        end_time = time.perf_counter()
 
-            messages = await builder.send()
+        assert end_time - start_time < 0.5
+        for messages in results:
             assert len(messages) == 1
-            assert isinstance(messages[0], MagicMock)
-
-        end_time = time.time()
-        assert end_time - start_time < 3.0
+            assert messages[0] is mock_message
 
     @pytest.mark.slow
-    def test_many_fields_performance(self, mock_context):
-        builder = EmbedBuilder(mock_context)
-
-        start_time = time.time()
+    def test_many_fields_performance(self, mock_context, benchmark):
+        def add_fields(builder):
+            for i in range(25):
+                builder.add_field(f"Field {i}", f"Value {i}", i % 2 == 0)
+            return builder
 
-        for i in range(25):
-            builder.add_field(f"Field {i}", f"Value {i}", i % 2 == 0)
+        builder = benchmark.pedantic(
+            add_fields, setup=lambda: ((EmbedBuilder(mock_context),), {}), rounds=100)
 
-        end_time = time.time()
-
-        assert end_time - start_time < 1.0
+        assert_stat_below(benchmark, 'median', 1.0)
         assert isinstance(builder, EmbedBuilder)
+        assert len(builder._fields) == 25
 
     @pytest.mark.slow
-    def test_method_chaining_performance(self, mock_context):
-        start_time = time.time()
-
-        builder = (EmbedBuilder(mock_context)
-                   .set_title("Title")
-                   .set_description("Description")
-                   .set_color(discord.Color.blue())
-                   .set_url("https://example.com")
-                   .set_author("Author", "https://example.com/icon.png")
-                   .set_footer("Footer", "https://example.com/footer.png")
-                   .set_thumbnail("https://example.com/thumb.png")
-                   .set_image("https://example.com/image.png")
-                   .add_field("F1", "V1", True)
-                   .add_field("F2", "V2", False)
-                   .add_field("F3", "V3", True)
-                   .set_content("Content")
-                   .set_reply(True)
-                   .set_ephemeral(False)
-                   .enable_pagination()
-                   .set_timezone('UTC'))
-
-        end_time = time.time()
-
-        assert end_time - start_time < 0.1
+    def test_method_chaining_performance(self, mock_context, benchmark):
+        color = discord.Color.blue()
+
+        def build():
+            return (EmbedBuilder(mock_context)
+                    .set_title("Title")
+                    .set_description("Description")
+                    .set_color(color)
+                    .set_url("https://example.com")
+                    .set_author("Author", "https://example.com/icon.png")
+                    .set_footer("Footer", "https://example.com/footer.png")
+                    .set_thumbnail("https://example.com/thumb.png")
+                    .set_image("https://example.com/image.png")
+                    .add_field("F1", "V1", True)
+                    .add_field("F2", "V2", False)
+                    .add_field("F3", "V3", True)
+                    .set_content("Content")
+                    .set_reply(True)
+                    .set_ephemeral(False)
+                    .enable_pagination()
+                    .set_timezone('UTC'))
+
+        builder = benchmark(build)
+
+        assert_stat_below(benchmark, 'median', 0.1)
         assert isinstance(builder, EmbedBuilder)
 
 
@@ -105,24 +142,31 @@ class TestMemoryUsage:
     @pytest.mark.slow
     def test_memory_usage_many_builders(self, mock_context):
         import gc
-
-        gc.collect()
-        initial_objects = len(gc.get_objects())
-
-        builders = []
-        for i in range(1000):
-            builder = EmbedBuilder(mock_context)
-            builder.set_title(f"Title {i}")
-            builder.set_description(f"Description {i}")
-            builders.append(builder)
-
-        gc.collect()
-
-        builders.clear()
-        gc.collect()
-        final_objects = len(gc.get_objects())
-
-        assert final_objects - initial_objects < 100
+        import tracemalloc
+
+        # Park everything already alive in the permanent generation so the
+        # collect below only walks what this test allocated.
+        gc.freeze()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+
+            builders = []
+            for i in range(1000):
+                builder = EmbedBuilder(mock_context)
+                builder.set_title(f"Title {i}")
+                builder.set_description(f"Description {i}")
+                builders.append(builder)
+
+            builders.clear()
+            gc.collect()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+            gc.unfreeze()
+
+        leaked = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+        assert leaked < 100_000
 
     @pytest.mark.slow
     def test_large_embed_content_memory(self, mock_context):
@@ -139,16 +183,12 @@ class TestConcurrency:
     @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_concurrent_embed_building(self, mock_context):
-        def create_mock_message(i):
-            mock_message = MagicMock(spec=discord.Message)
-            mock_embed = MagicMock(spec=discord.Embed)
-            mock_embed.title = f"Title {i}"
-            mock_embed.description = f"Description {i}"
-            mock_message.embeds = [mock_embed]
-            return mock_message
-
-        mock_messages = [create_mock_message(i) for i in range(50)]
-        mock_context.reply = AsyncMock(side_effect=mock_messages)
+        mock_messages = [
+            SimpleNamespace(embeds=[SimpleNamespace(
+                title=f"Title {i}", description=f"Description {i}")])
+            for i in range(50)
+        ]
+        mock_context.reply = AsyncMock(side_effect=iter(mock_messages))
 
         async def build_embed(i):
             builder = EmbedBuilder(mock_context)
@@ -159,9 +199,9 @@ class TestConcurrency:
             return messages[0]
 
         tasks = [build_embed(i) for i in range(50)]
-        start_time = time.time()
+        start_time = time.perf_counter()
         messages = await asyncio.gather(*tasks)
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         assert len(messages) == 50
         assert end_time - start_time < 5.0
@@ -175,62 +215,44 @@ class TestConcurrency:
 
 class TestEdgeCasePerformance:
     @pytest.mark.slow
-    def test_empty_string_operations(self, mock_context):
+    @pytest.mark.parametrize("setter", ["set_title", "set_description", "set_url", "set_content"])
+    def test_empty_string_operations(self, mock_context, benchmark, setter):
         builder = EmbedBuilder(mock_context)
 
-        start_time = time.time()
-
-        for _ in range(10000):
-            builder.set_title("")
-            builder.set_description("")
-            builder.set_url("")
-            builder.set_content("")
+        result = benchmark.pedantic(getattr(builder, setter), args=("",),
+                                    iterations=10000, rounds=5)
 
-        end_time = time.time()
-        assert end_time - start_time < 2.0
+        # The old bound was 2.0s for 10000 rounds of all four setters.
+        assert_stat_below(benchmark, 'mean', 2.0 / (10000 * 4))
+        assert result is builder
 
     @pytest.mark.slow
-    def test_unicode_text_performance(self, mock_context):
-        unicode_text = "testðŸŽ‰testðŸš€" * 50
+    def test_unicode_text_performance(self, mock_context, benchmark):
+        chunks = benchmark(chunk_text, UNICODE_TEXT, max_chunk_size=1000)
 
-        start_time = time.time()
-        chunks = chunk_text(unicode_text, max_chunk_size=1000)
-        end_time = time.time()
-
-        assert end_time - start_time < 1.0
+        assert_stat_below(benchmark, 'median', 1.0)
         assert len(chunks) >= 1
 
     @pytest.mark.slow
-    def test_nested_markdown_performance(self, mock_context):
-        markdown_text = """
-        # Header
-        **Bold** and *italic*
-        `code`
-        > Quote
-        - List item
-        """ * 100
-
-        start_time = time.time()
-        chunks = chunk_text(markdown_text, max_chunk_size=2000)
-        end_time = time.time()
+    def test_nested_markdown_performance(self, mock_context, benchmark):
+        chunks = benchmark(chunk_text, MARKDOWN_TEXT, max_chunk_size=2000)
 
-        assert end_time - start_time < 2.0
+        assert_stat_below(benchmark, 'median', 2.0)
         assert len(chunks) >= 1
 
 
 class TestStressTests:
     @pytest.mark.slow
-    def test_maximum_fields_stress(self, mock_context):
-        builder = EmbedBuilder(mock_context)
-
+    def test_maximum_fields_stress(self, mock_context, benchmark):
         fields = [(f"Field {i}", f"Value {i}", i % 2 == 0) for i in range(25)]
 
-        start_time = time.time()
-        builder.add_fields(fields)
-        end_time = time.time()
+        builder = benchmark.pedantic(
+            lambda builder: builder.add_fields(fields),
+            setup=lambda: ((EmbedBuilder(mock_context),), {}), rounds=100)
 
-        assert end_time - start_time < 0.5
+        assert_stat_below(benchmark, 'median', 0.01)
         assert isinstance(builder, EmbedBuilder)
+        assert len(builder._fields) == 25
 
     @pytest.mark.slow
     def test_maximum_description_length_stress(self, mock_context):
@@ -238,9 +260,9 @@ class TestStressTests:
 
         builder = EmbedBuilder(mock_context)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         builder.set_description(max_description)
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         assert end_time - start_time < 0.1
         assert isinstance(builder, EmbedBuilder)
@@ -250,16 +272,17 @@ class TestStressTests:
     async def test_rapid_method_calls(self, mock_context):
         builder = EmbedBuilder(mock_context)
         builder.set_author("Test Author")
+        color = discord.Color.blue()
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         for i in range(1000):
             (builder
              .set_title(f"Title {i}")
              .set_description(f"Desc {i}")
-             .set_color(discord.Color.blue()))
+             .set_color(color))
 
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         assert end_time - start_time < 1.0
         assert isinstance(builder, EmbedBuilder)
@@ -269,4 +292,4 @@ pytestmark = pytest.mark.slow
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v", "-m", "slow"])
+    pytest.main([__file__, "-v", "--runslow"])